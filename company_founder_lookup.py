@@ -1,11 +1,24 @@
+import aiohttp # For async scraping: pip install aiohttp
+import asyncio # For concurrent API calls
+import atexit # To stop the log listener on exit
 import csv
+import functools # For memoizing per-company regexes
+import hashlib # For cache keys
+import json # For JSON-mode batch responses
+import logging
+import logging.handlers
+import queue # Feeds the background logging thread
+import random # For retry backoff jitter
+import sqlite3 # For the persistent response cache
 import time
 import os
+from dataclasses import dataclass
 import openai # Make sure to install this: pip install openai
+import tiktoken # For token-count estimates: pip install tiktoken
 from dotenv import load_dotenv # Make sure to install this: pip install python-dotenv
-import requests # For HTTP requests: pip install requests
-from bs4 import BeautifulSoup # For parsing HTML: pip install beautifulsoup4
+from selectolax.parser import HTMLParser # For parsing HTML: pip install selectolax
 import re # For regular expressions
+import numpy as np # For semantic cache similarity: pip install numpy
 from urllib.parse import quote_plus # For URL encoding search queries
 
 # Load environment variables from .env file
@@ -17,10 +30,30 @@ OUTPUT_CSV_FILE = 'Unicorns_cleaned_with_founders.csv' # Output file
 COMPANY_NAME_COLUMN = 'Company'
 FOUNDERS_COLUMN = 'Founders' # Name of the column to add/update
 LOG_FILE = 'founder_lookup_log.txt'
-API_CALL_DELAY_SECONDS = 2       # Delay between OpenAI API calls
-SCRAPE_DELAY_SECONDS = 3     # Delay between general web scraping requests
+CACHE_DB_FILE = 'cache.sqlite'   # Persistent cache of OpenAI responses
+SEMANTIC_CACHE_EMBEDDINGS_FILE = 'semantic_cache_embeddings.npy'
+SEMANTIC_CACHE_ENTRIES_FILE = 'semantic_cache_entries.json'
+SEMANTIC_SIMILARITY_THRESHOLD = 0.95 # Cosine similarity needed for a cache hit
+EMBEDDING_MODEL = 'text-embedding-3-small'
+EMBEDDING_DIMENSIONS = 1536
+EMBEDDING_BATCH_SIZE = 100       # Company names embedded per API call
+OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-4o-mini') # Cheaper than 3.5-turbo with higher TPM
+USE_OPENAI_BATCH_API = os.getenv('OPENAI_USE_BATCH_API', '').lower() in ('1', 'true', 'yes')
+BATCH_API_INPUT_FILE = 'openai_batch_input.jsonl'
+BATCH_API_POLL_SECONDS = 60    # How often to poll a submitted Batch API job
+MAX_CONCURRENT_REQUESTS = 20   # Cap on in-flight OpenAI calls (asyncio.Semaphore)
+MAX_REQUESTS_PER_MINUTE = 3000 # Keep a margin under the account's RPM limit
+MAX_TOKENS_PER_MINUTE = 85000  # Keep a margin under the account's TPM limit
+MAX_API_RETRIES = 5            # Attempts per request when rate limited
+OPENAI_BATCH_SIZE = 15         # Companies packed into one JSON-mode completion
+SCRAPE_CONCURRENCY = 8       # Cap on in-flight scraping requests
+SCRAPE_RETRY_TOTAL = 3         # Retries per scrape request on 429/transient 5xx
+SCRAPE_RETRY_BACKOFF = 0.5     # Base of the exponential retry backoff (seconds)
 REQUEST_TIMEOUT_SECONDS = 15   # Timeout for web requests
+WIKIDATA_API_URL = 'https://www.wikidata.org/w/api.php'
+WIKIDATA_SPARQL_URL = 'https://query.wikidata.org/sparql'
 MAX_SEARCH_SNIPPETS = 5        # Number of search result snippets to feed to OpenAI
+MAX_PROMPT_TOKENS = 15000      # Keep prompts well under the model context; leave headroom for the completion
 
 NOT_FOUND_MARKER = "Not Found"
 ERROR_MARKERS = [
@@ -35,7 +68,7 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 client = None
 if OPENAI_API_KEY:
     try:
-        client = openai.OpenAI(api_key=OPENAI_API_KEY)
+        client = openai.AsyncOpenAI(api_key=OPENAI_API_KEY)
         print("OpenAI client initialized successfully.")
     except Exception as e:
         print(f"Error initializing OpenAI client: {e}")
@@ -46,15 +79,337 @@ COMMON_REQUEST_HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
 }
 
-def log_message(message):
-    timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
-    full_message = f"{timestamp} - {message}"
-    print(full_message)
+# All scraping shares one aiohttp session, created lazily inside the running
+# event loop: TCP+TLS connections stay alive instead of paying the handshake on
+# every request. The semaphore bounds concurrency so DDG is not hammered; 429s
+# are handled by retry rather than a fixed inter-request sleep.
+_aiohttp_session = None
+_scrape_semaphore = None
+
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+async def get_scrape_session():
+    global _aiohttp_session, _scrape_semaphore
+    if _aiohttp_session is None or _aiohttp_session.closed:
+        _aiohttp_session = aiohttp.ClientSession(
+            headers=COMMON_REQUEST_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS))
+        _scrape_semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+    return _aiohttp_session
+
+async def close_scrape_session():
+    global _aiohttp_session
+    if _aiohttp_session is not None and not _aiohttp_session.closed:
+        await _aiohttp_session.close()
+    _aiohttp_session = None
+
+async def scrape_get(url, params=None):
+    """GETs a URL through the shared session and returns the body as bytes.
+
+    Retries 429s and transient 5xx responses with exponential backoff, up to
+    SCRAPE_RETRY_TOTAL times. The semaphore is held only while a request is in
+    flight, so a backing-off task does not block other scrapes.
+    """
+    session = await get_scrape_session()
+    last_error = None
+    for attempt in range(SCRAPE_RETRY_TOTAL + 1):
+        if attempt:
+            await asyncio.sleep(SCRAPE_RETRY_BACKOFF * (2 ** (attempt - 1)))
+        try:
+            async with _scrape_semaphore:
+                async with session.get(url, params=params) as response:
+                    if response.status in _RETRYABLE_STATUSES:
+                        last_error = aiohttp.ClientResponseError(
+                            response.request_info, response.history,
+                            status=response.status, message=response.reason)
+                        continue
+                    response.raise_for_status()
+                    return await response.read()
+        except aiohttp.ClientError as e:
+            last_error = e
+    raise last_error
+
+# --- Rate limiting (modeled on the OpenAI cookbook api_request_parallel_processor) ---
+try:
+    _TOKEN_ENCODING = tiktoken.encoding_for_model(OPENAI_MODEL)
+except KeyError:
+    _TOKEN_ENCODING = tiktoken.get_encoding("cl100k_base")
+
+def estimate_request_tokens(messages, max_tokens):
+    """Estimates a chat completion's token cost: prompt tokens plus the completion budget."""
+    prompt_text = "".join(m["content"] for m in messages)
+    return len(_TOKEN_ENCODING.encode(prompt_text)) + max_tokens
+
+@dataclass
+class StatusTracker:
+    """Counters for the run, logged when processing finishes."""
+    num_in_progress: int = 0
+    num_succeeded: int = 0
+    num_failed: int = 0
+    num_rate_limit_errors: int = 0
+
+status_tracker = StatusTracker()
+
+class RateLimiter:
+    """Token-bucket throttle tracking both request (RPM) and token (TPM) capacity.
+
+    Capacity replenishes continuously at the per-minute rate, so bursts can use
+    the full budget instead of a fixed per-call delay.
+    """
+    def __init__(self, requests_per_minute, tokens_per_minute):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.available_request_capacity = float(requests_per_minute)
+        self.available_token_capacity = float(tokens_per_minute)
+        self.last_update_time = time.monotonic()
+
+    def _replenish(self):
+        now = time.monotonic()
+        elapsed = now - self.last_update_time
+        self.available_request_capacity = min(
+            self.available_request_capacity + elapsed * self.requests_per_minute / 60.0,
+            float(self.requests_per_minute))
+        self.available_token_capacity = min(
+            self.available_token_capacity + elapsed * self.tokens_per_minute / 60.0,
+            float(self.tokens_per_minute))
+        self.last_update_time = now
+
+    async def acquire(self, token_estimate):
+        while True:
+            self._replenish()
+            if self.available_request_capacity >= 1 and self.available_token_capacity >= token_estimate:
+                self.available_request_capacity -= 1
+                self.available_token_capacity -= token_estimate
+                return
+            await asyncio.sleep(0.05)
+
+rate_limiter = RateLimiter(MAX_REQUESTS_PER_MINUTE, MAX_TOKENS_PER_MINUTE)
+
+async def create_chat_completion_throttled(**request_kwargs):
+    """Issues a chat completion through the rate limiter, retrying 429s with backoff."""
+    token_estimate = estimate_request_tokens(request_kwargs["messages"], request_kwargs.get("max_tokens", 0))
+    last_rate_limit_error = None
+    for attempt in range(MAX_API_RETRIES):
+        await rate_limiter.acquire(token_estimate)
+        status_tracker.num_in_progress += 1
+        try:
+            completion = await client.chat.completions.create(**request_kwargs)
+            status_tracker.num_succeeded += 1
+            return completion
+        except openai.RateLimitError as e:
+            last_rate_limit_error = e
+            status_tracker.num_rate_limit_errors += 1
+            backoff_seconds = 2 ** attempt + random.random()
+            log_message(f"Rate limited by OpenAI API; retrying in {backoff_seconds:.1f}s (attempt {attempt + 1}/{MAX_API_RETRIES}).")
+            await asyncio.sleep(backoff_seconds)
+        finally:
+            status_tracker.num_in_progress -= 1
+    status_tracker.num_failed += 1
+    raise last_rate_limit_error
+
+# --- Response cache ---
+# Both call paths use temperature 0.0, so identical requests give identical
+# answers and exact-match caching is semantically safe. Reruns (debugging,
+# resuming, appending new unicorns) only pay for companies not seen before.
+_cache_conn = sqlite3.connect(CACHE_DB_FILE)
+_cache_conn.execute("CREATE TABLE IF NOT EXISTS llm_cache(key TEXT PRIMARY KEY, response TEXT, ts INTEGER)")
+_cache_conn.execute("CREATE TABLE IF NOT EXISTS wikidata_qid(company TEXT PRIMARY KEY, qid TEXT)")
+_cache_conn.commit()
+
+def _get_cached_qid(company_name):
+    row = _cache_conn.execute("SELECT qid FROM wikidata_qid WHERE company=?", (company_name,)).fetchone()
+    return row[0] if row else None
+
+def _store_cached_qid(company_name, qid):
+    _cache_conn.execute("INSERT OR REPLACE INTO wikidata_qid(company, qid) VALUES (?, ?)", (company_name, qid))
+    _cache_conn.commit()
+
+def _cache_key(request_kwargs):
+    payload = json.dumps(
+        {"model": request_kwargs.get("model"),
+         "messages": request_kwargs.get("messages"),
+         "temp": request_kwargs.get("temperature")},
+        sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+async def create_chat_completion_cached(**request_kwargs):
+    """Returns the completion's message text, serving repeats from the SQLite cache."""
+    key = _cache_key(request_kwargs)
+    cached = _cache_conn.execute("SELECT response FROM llm_cache WHERE key=?", (key,)).fetchone()
+    if cached is not None:
+        return cached[0]
+
+    completion = await create_chat_completion_throttled(**request_kwargs)
+    response_text = completion.choices[0].message.content
+    _cache_conn.execute("INSERT OR REPLACE INTO llm_cache(key, response, ts) VALUES (?, ?, ?)",
+                        (key, response_text, int(time.time())))
+    _cache_conn.commit()
+    return response_text
+
+# --- Semantic cache ---
+# Exact caching misses trivial company-name variants ("OpenAI" vs "OpenAI, Inc.")
+# that are common in unicorn CSVs. The semantic cache embeds the normalized name
+# and reuses founders already resolved for a near-identical name.
+
+def normalize_company_name(company_name):
+    """Lowercases a company name and strips punctuation and legal suffixes."""
+    normalized = re.sub(r"[^a-z0-9& ]+", " ", company_name.casefold())
+    normalized = re.sub(r"\b(?:inc|llc|ltd|limited|corp|co|gmbh)\b", " ", normalized)
+    return re.sub(r"\s+", " ", normalized).strip()
+
+class SemanticCache:
+    """Maps company-name embeddings to previously resolved founders strings.
+
+    Embeddings are stored as one float32 matrix in a .npy file; a parallel JSON
+    file holds the company name and founders string for each row.
+    """
+    def __init__(self):
+        self.entries = []
+        self.embeddings = np.empty((0, EMBEDDING_DIMENSIONS), dtype=np.float32)
+        if os.path.exists(SEMANTIC_CACHE_EMBEDDINGS_FILE) and os.path.exists(SEMANTIC_CACHE_ENTRIES_FILE):
+            try:
+                self.embeddings = np.load(SEMANTIC_CACHE_EMBEDDINGS_FILE).astype(np.float32)
+                with open(SEMANTIC_CACHE_ENTRIES_FILE, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+                print(f"Semantic cache loaded with {len(self.entries)} entries.")
+            except Exception as e:
+                print(f"Error loading semantic cache, starting empty: {e}")
+                self.entries = []
+                self.embeddings = np.empty((0, EMBEDDING_DIMENSIONS), dtype=np.float32)
+        self._norms = np.linalg.norm(self.embeddings, axis=1)
+
+    def lookup(self, query_embedding):
+        """Returns the {'company', 'founders'} entry nearest the query, or None."""
+        if not self.entries:
+            return None
+        query_norm = np.linalg.norm(query_embedding)
+        if query_norm == 0:
+            return None
+        similarities = self.embeddings @ query_embedding / (self._norms * query_norm + 1e-10)
+        best_index = int(np.argmax(similarities))
+        if similarities[best_index] > SEMANTIC_SIMILARITY_THRESHOLD:
+            return self.entries[best_index]
+        return None
+
+    def add(self, company_name, query_embedding, founders_str):
+        if query_embedding is None:
+            return
+        self.entries.append({"company": company_name, "founders": founders_str})
+        self.embeddings = np.vstack([self.embeddings, query_embedding.reshape(1, -1)])
+        self._norms = np.append(self._norms, np.linalg.norm(query_embedding))
+
+    def save(self):
+        try:
+            np.save(SEMANTIC_CACHE_EMBEDDINGS_FILE, self.embeddings)
+            with open(SEMANTIC_CACHE_ENTRIES_FILE, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f)
+        except Exception as e:
+            log_message(f"Error saving semantic cache: {e}")
+
+semantic_cache = SemanticCache()
+
+async def embed_company_names(company_names):
+    """Embeds normalized company names, EMBEDDING_BATCH_SIZE per API call.
+
+    Returns a list of float32 vectors aligned with company_names, or None if the
+    client is unavailable or the embedding calls fail.
+    """
+    if not client:
+        return None
+    vectors = []
     try:
-        with open(LOG_FILE, 'a', encoding='utf-8') as f:
-            f.write(full_message + "\n")
+        for start in range(0, len(company_names), EMBEDDING_BATCH_SIZE):
+            batch = [normalize_company_name(name) for name in company_names[start:start + EMBEDDING_BATCH_SIZE]]
+            response = await client.embeddings.create(model=EMBEDDING_MODEL, input=batch)
+            vectors.extend(np.asarray(item.embedding, dtype=np.float32) for item in response.data)
+        return vectors
+    except openai.APIError as e:
+        log_message(f"OpenAI API Error while embedding company names: {e}. Semantic cache disabled for this run.")
+        return None
     except Exception as e:
-        print(f"Error writing to log file: {e}")
+        log_message(f"Unexpected error while embedding company names: {e}. Semantic cache disabled for this run.")
+        return None
+
+# Logging goes through a queue to a background listener thread, so the hot
+# loop never opens the log file or blocks on disk. The file handler is opened
+# once (lazily, after __main__ truncates the log) instead of per message.
+_log_formatter = logging.Formatter('%(asctime)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+_log_file_handler = logging.FileHandler(LOG_FILE, encoding='utf-8', delay=True)
+_log_file_handler.setFormatter(_log_formatter)
+_log_console_handler = logging.StreamHandler()
+_log_console_handler.setFormatter(_log_formatter)
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_file_handler, _log_console_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logger = logging.getLogger('founder_lookup')
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+
+def log_message(message):
+    logger.info(message)
+
+# One alternation scanned once per response instead of ~10 independent Python
+# substring searches; matters most on long snippet-derived responses.
+_NOTFOUND_RE = re.compile(
+    r"not found|couldn't find|unable to find|no founder information"
+    r"|i do(?:n'| no)t have access to that information|i cannot provide"
+    r"|information on the founders is not publicly available"
+    r"|does not have clearly defined founders in the traditional sense",
+    re.IGNORECASE)
+_SEP_RE = re.compile(r'\s+(?:and|&)\s+', re.IGNORECASE)
+
+# Keywords that mark a "name" as leftover boilerplate rather than a person
+_BAD_NAME_KEYWORDS = ("various", "associates", "others", "group of", "team of",
+                      "llc", "inc", "co.", "limited", "corp", "gmbh")
+
+# Boilerplate phrases fused into single alternations so each founder string is
+# scanned once, not once per phrase. Company-independent phrases compile at
+# import time; company-specific ones compile once per company.
+_STATIC_PHRASES = (
+    "The founders are typically listed as ",
+    "The founders of this company are ",
+    "The founders are ",
+    "Founders are ",
+    "The founder is ",
+    "Founder is ",
+    "Key figures associated with the founding include ",
+    "The company was co-founded by ",
+    "The company was founded by ",
+    "Co-founded by ",
+    "Founded by ",
+)
+_STATIC_PHRASES = _STATIC_PHRASES \
+    + tuple(p.replace(" are", " include") for p in _STATIC_PHRASES if " are" in p) \
+    + tuple(p.replace(" is", " includes") for p in _STATIC_PHRASES if " is" in p)
+_STATIC_BOILERPLATE_RE = re.compile("|".join(re.escape(p) for p in _STATIC_PHRASES), re.IGNORECASE)
+
+_COMPANY_PHRASE_TEMPLATES = (
+    "The founders of {c} are typically listed as ",
+    "The founders of {c} are ",
+    "Founders of {c} are ",
+    "{c}'s founders are ",
+    "The founders of the company '{c}' are ",
+    "The founder of {c} is ",
+    "Founder of {c} is ",
+    "{c}'s founder is ",
+    "The founder of the company '{c}' is ",
+)
+_COMPANY_PHRASE_TEMPLATES = _COMPANY_PHRASE_TEMPLATES \
+    + tuple(t.replace(" are", " include") for t in _COMPANY_PHRASE_TEMPLATES if " are" in t) \
+    + tuple(t.replace(" is", " includes") for t in _COMPANY_PHRASE_TEMPLATES if " is" in t)
+
+@functools.lru_cache(maxsize=4096)
+def _company_boilerplate_re(company_name):
+    """Compiles one alternation of the company-specific boilerplate phrases.
+
+    Memoized so retries, cache hits, and repeated rows for the same company
+    never re-escape the name or recompile the pattern.
+    """
+    escaped_company_name = re.escape(company_name)
+    return re.compile("|".join(t.format(c=escaped_company_name) for t in _COMPANY_PHRASE_TEMPLATES),
+                      re.IGNORECASE)
 
 def clean_founder_string(text, company_name):
     """Cleans a string of founder names, removing boilerplate, normalizing separators."""
@@ -62,55 +417,17 @@ def clean_founder_string(text, company_name):
         return NOT_FOUND_MARKER
     
     text = text.strip()
-    normalized_text_lower = text.lower()
-
-    # Check for known error/not found markers first
-    if text in ERROR_MARKERS or \
-       "not found" in normalized_text_lower or \
-       "couldn't find" in normalized_text_lower or \
-       "unable to find" in normalized_text_lower or \
-       "no founder information" in normalized_text_lower or \
-       "i do not have access to that information" in normalized_text_lower or \
-       "i don't have access to that information" in normalized_text_lower or \
-       "i cannot provide" in normalized_text_lower or \
-       "information on the founders is not publicly available" in normalized_text_lower or \
-       "does not have clearly defined founders in the traditional sense" in normalized_text_lower or \
-       text == "N/A": # Common way LLMs might indicate not found
+
+    # Check for known error/not found markers first: one compiled-alternation scan
+    if text in ERROR_MARKERS or text == "N/A" or _NOTFOUND_RE.search(text):
         return NOT_FOUND_MARKER
 
-    # Remove common boilerplate phrases
-    # Using re.escape on company_name in case it has special regex characters
-    escaped_company_name = re.escape(company_name)
-    phrases_to_remove = [
-        f"The founders of {escaped_company_name} are typically listed as ",
-        f"The founders of {escaped_company_name} are ",
-        f"Founders of {escaped_company_name} are ",
-        f"{escaped_company_name}'s founders are ",
-        f"The founders of the company '{escaped_company_name}' are ",
-        f"The founder of {escaped_company_name} is ",
-        f"Founder of {escaped_company_name} is ",
-        f"{escaped_company_name}'s founder is ",
-        f"The founder of the company '{escaped_company_name}' is ",
-        "The founders are typically listed as ",
-        "The founders of this company are ",
-        "The founders are ",
-        "Founders are ",
-        "The founder is ",
-        "Founder is ",
-        "Key figures associated with the founding include ",
-        "The company was co-founded by ",
-        "The company was founded by ",
-        "Co-founded by ",
-        "Founded by ",
-    ]
-    phrases_to_remove.extend([p.replace(" are", " include") for p in phrases_to_remove if " are" in p])
-    phrases_to_remove.extend([p.replace(" is", " includes") for p in phrases_to_remove if " is" in p])
-
-    for phrase in phrases_to_remove:
-        text = re.sub(phrase, "", text, flags=re.IGNORECASE).strip()
-    
+    # Remove common boilerplate phrases: one company-specific pass, one static pass
+    text = _company_boilerplate_re(company_name).sub("", text).strip()
+    text = _STATIC_BOILERPLATE_RE.sub("", text).strip()
+
     # Normalize separators: " and ", " & "
-    text = re.sub(r'\s+(?:and|&)\s+', ", ", text, flags=re.IGNORECASE)
+    text = _SEP_RE.sub(", ", text)
     text = text.replace(';', ',') # Replace semicolons with commas
     text = text.replace('•', ',') # Replace bullets with commas
     
@@ -119,14 +436,16 @@ def clean_founder_string(text, company_name):
     
     seen = set()
     unique_names = []
+    company_lower = company_name.casefold() # Folded once, not per name
     for name_part in names:
         cleaned_name = re.sub(r'\s*\(.*?\)\s*', '', name_part).strip()
         if cleaned_name.endswith("."):
             cleaned_name = cleaned_name[:-1].strip()
-        
-        if cleaned_name and cleaned_name.lower() != company_name.lower() and \
+
+        name_lower = cleaned_name.casefold()
+        if cleaned_name and name_lower != company_lower and \
            len(cleaned_name.split()) < 5 and \
-           not any(kw in cleaned_name.lower() for kw in ["various", "associates", "others", "group of", "team of", "llc", "inc", "co.", "limited", "corp", "gmbh"]):
+           not any(kw in name_lower for kw in _BAD_NAME_KEYWORDS):
             if cleaned_name not in seen:
                 unique_names.append(cleaned_name)
                 seen.add(cleaned_name)
@@ -136,27 +455,21 @@ def clean_founder_string(text, company_name):
         
     return ", ".join(unique_names)
 
-def search_duckduckgo_for_snippets(company_name):
+async def search_duckduckgo_for_snippets(company_name):
     log_message(f"Searching DuckDuckGo for '{company_name}' founders...")
     search_query = f"{company_name} founders"
     url = f"https://html.duckduckgo.com/html/?q={quote_plus(search_query)}"
-    
+
     snippets = []
     try:
-        response = requests.get(url, headers=COMMON_REQUEST_HEADERS, timeout=REQUEST_TIMEOUT_SECONDS)
-        response.raise_for_status()
-        time.sleep(SCRAPE_DELAY_SECONDS)
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        results = soup.find_all('div', class_='result__body')
-        
-        for i, result in enumerate(results):
-            if i >= MAX_SEARCH_SNIPPETS:
-                break
-            title_tag = result.find('a', class_='result__a')
-            snippet_tag = result.find('a', class_='result__snippet')
-            title = title_tag.get_text(strip=True) if title_tag else ""
-            snippet_text = snippet_tag.get_text(strip=True) if snippet_tag else ""
+        html = await scrape_get(url)
+
+        tree = HTMLParser(html)
+        for result in tree.css('div.result__body')[:MAX_SEARCH_SNIPPETS]:
+            title_node = result.css_first('a.result__a')
+            snippet_node = result.css_first('a.result__snippet')
+            title = title_node.text(strip=True) if title_node else ""
+            snippet_text = snippet_node.text(strip=True) if snippet_node else ""
             if title or snippet_text:
                 snippets.append(f"Title: {title}\nSnippet: {snippet_text}")
         
@@ -166,31 +479,40 @@ def search_duckduckgo_for_snippets(company_name):
             log_message(f"No snippets found on DuckDuckGo for '{company_name}'.")
         return "\n---\n".join(snippets)
         
-    except requests.exceptions.RequestException as e:
+    except aiohttp.ClientError as e:
         log_message(f"Error scraping DuckDuckGo for '{company_name}': {e}")
         return ""
     except Exception as e:
         log_message(f"Unexpected error during DuckDuckGo search for '{company_name}': {e}")
         return ""
 
-def get_founders_via_openai_with_context(company_name, context_snippets):
+async def get_founders_via_openai_with_context(company_name, context_snippets):
     if not client:
         log_message("OpenAI client not initialized. Cannot call API.")
         return NOT_FOUND_MARKER
 
     log_message(f"Attempting to find founders for '{company_name}' via OpenAI API with search context...")
     try:
-        prompt = f"Based on the following search result snippets, who are the founders of the company '{company_name}'? Please list their full names, separated by commas. Snippets:\n\n{context_snippets}\n\nIf you cannot determine the founders from this text, respond with only the text 'Not Found'.\""
-        
-        # Truncate prompt if too long (OpenAI has token limits)
-        # A more sophisticated approach would use tiktoken to count tokens
-        max_prompt_length = 3500 # Approximate character limit for safety
-        if len(prompt) > max_prompt_length:
-            prompt = prompt[:max_prompt_length] + "... [prompt truncated]"
-            log_message(f"Prompt for {company_name} was truncated due to length.")
-
-        completion = client.chat.completions.create(
-            model="gpt-3.5-turbo",
+        def build_prompt(snippets_text):
+            return f"Based on the following search result snippets, who are the founders of the company '{company_name}'? Please list their full names, separated by commas. Snippets:\n\n{snippets_text}\n\nIf you cannot determine the founders from this text, respond with only the text 'Not Found'.\""
+
+        # Truncate by token count, not characters. Whole snippets are dropped
+        # from the tail until the prompt fits, so the model never sees a snippet
+        # cut mid-sentence; a hard token slice only applies if a single snippet
+        # is still too large on its own.
+        snippet_parts = context_snippets.split("\n---\n")
+        prompt = build_prompt(context_snippets)
+        while len(_TOKEN_ENCODING.encode(prompt)) > MAX_PROMPT_TOKENS and len(snippet_parts) > 1:
+            snippet_parts.pop()
+            prompt = build_prompt("\n---\n".join(snippet_parts))
+            log_message(f"Dropped a snippet for {company_name} to fit the token budget ({len(snippet_parts)} remain).")
+        prompt_tokens = _TOKEN_ENCODING.encode(prompt)
+        if len(prompt_tokens) > MAX_PROMPT_TOKENS:
+            prompt = _TOKEN_ENCODING.decode(prompt_tokens[:MAX_PROMPT_TOKENS])
+            log_message(f"Prompt for {company_name} was truncated to {MAX_PROMPT_TOKENS} tokens.")
+
+        response_text = await create_chat_completion_cached(
+            model=OPENAI_MODEL,
             messages=[
                 {"role": "system", "content": "You are a helpful assistant that extracts founder names from provided text. Respond with only comma-separated names or 'Not Found'."},
                 {"role": "user", "content": prompt}
@@ -198,9 +520,7 @@ def get_founders_via_openai_with_context(company_name, context_snippets):
             temperature=0.0, # Sticking to facts from the text
             max_tokens=150
         )
-        time.sleep(API_CALL_DELAY_SECONDS)
-        response_text = completion.choices[0].message.content.strip()
-        return response_text # Raw response, will be cleaned by clean_founder_string
+        return response_text.strip() # Raw response, will be cleaned by clean_founder_string
         
     except openai.APIError as e:
         log_message(f"OpenAI API Error (with context) for '{company_name}': {e}")
@@ -209,14 +529,139 @@ def get_founders_via_openai_with_context(company_name, context_snippets):
         log_message(f"Unexpected error during OpenAI API call (with context) for '{company_name}': {e}")
         return ERROR_MARKERS[2]
 
-def get_founders_for_company(company_name):
+async def get_founders_via_wikidata(company_name):
+    """Looks up founders from Wikidata's P112 (founder) claim.
+
+    Resolves the company to a QID with wbsearchentities (cached in SQLite),
+    then asks the SPARQL endpoint for founder labels. Returns a comma-separated
+    string of names, or NOT_FOUND_MARKER when the entity cannot be resolved or
+    has no founder claim.
+    """
+    try:
+        qid = _get_cached_qid(company_name)
+        if qid is None:
+            params = {'action': 'wbsearchentities', 'search': company_name,
+                      'language': 'en', 'format': 'json', 'type': 'item'}
+            search_results = json.loads(await scrape_get(WIKIDATA_API_URL, params=params))
+            hits = search_results.get('search') or []
+            if not hits:
+                log_message(f"No Wikidata entity found for '{company_name}'.")
+                return NOT_FOUND_MARKER
+            qid = hits[0]['id']
+            _store_cached_qid(company_name, qid)
+
+        sparql_query = (
+            "SELECT ?founderLabel WHERE { wd:%s wdt:P112 ?founder. "
+            "SERVICE wikibase:label { bd:serviceParam wikibase:language \"en\". } }" % qid)
+        sparql_results = json.loads(await scrape_get(
+            WIKIDATA_SPARQL_URL, params={'query': sparql_query, 'format': 'json'}))
+
+        bindings = sparql_results.get('results', {}).get('bindings', [])
+        founder_names = [b['founderLabel']['value'] for b in bindings if 'founderLabel' in b]
+        # Entities without an English label come back as bare QIDs; skip those
+        founder_names = [name for name in founder_names if not re.fullmatch(r'Q\d+', name)]
+        if founder_names:
+            return ", ".join(dict.fromkeys(founder_names))
+        return NOT_FOUND_MARKER
+
+    except aiohttp.ClientError as e:
+        log_message(f"Error querying Wikidata for '{company_name}': {e}")
+        return NOT_FOUND_MARKER
+    except Exception as e:
+        log_message(f"Unexpected error during Wikidata lookup for '{company_name}': {e}")
+        return NOT_FOUND_MARKER
+
+async def get_founders_via_openai(company_name):
+    """Asks the model directly for one company's founders, with no search context."""
+    if not client:
+        return NOT_FOUND_MARKER
+
+    log_message(f"Attempting direct OpenAI lookup for '{company_name}' (no search context)...")
+    try:
+        response_text = await create_chat_completion_cached(
+            model=OPENAI_MODEL,
+            messages=[
+                {"role": "system", "content": "You are a helpful assistant that knows company founders. Respond with only comma-separated full names or 'Not Found'."},
+                {"role": "user", "content": f"Who are the founders of the company '{company_name}'? List their full names, separated by commas. If you do not know, respond with only the text 'Not Found'."}
+            ],
+            temperature=0.0,
+            max_tokens=150
+        )
+        return response_text.strip()
+
+    except openai.APIError as e:
+        log_message(f"OpenAI API Error (direct) for '{company_name}': {e}")
+        return ERROR_MARKERS[0]
+    except Exception as e:
+        log_message(f"Unexpected error during direct OpenAI API call for '{company_name}': {e}")
+        return ERROR_MARKERS[2]
+
+async def get_founders_via_openai_batch(company_names):
+    """Asks for the founders of several companies in a single JSON-mode request.
+
+    Returns a dict mapping each company name to the model's raw answer string.
+    Returns an empty dict when the client is unavailable or the reply cannot be
+    parsed, so callers fall back to per-company lookups.
+    """
+    if not client:
+        return {}
+
+    log_message(f"Querying OpenAI for a batch of {len(company_names)} companies...")
+    try:
+        prompt = (
+            "Return a JSON object mapping each of the following company names to a "
+            "comma-separated string of its founders' full names, or \"Not Found\" if "
+            f"you do not know the founders. Companies: {json.dumps(company_names)}"
+        )
+        response_text = await create_chat_completion_cached(
+            model=OPENAI_MODEL, # JSON mode requires gpt-3.5-turbo-1106+ or gpt-4o-mini
+            messages=[
+                {"role": "system", "content": "You are a helpful assistant that knows company founders. Respond with only a JSON object."},
+                {"role": "user", "content": prompt}
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.0,
+            max_tokens=1000
+        )
+        parsed = json.loads(response_text)
+        if not isinstance(parsed, dict):
+            log_message("Batch response was valid JSON but not an object. Falling back to per-company lookups.")
+            return {}
+        return {name: str(parsed[name]) for name in company_names if name in parsed}
+
+    except json.JSONDecodeError as e:
+        log_message(f"Could not parse batch JSON response: {e}. Falling back to per-company lookups.")
+        return {}
+    except openai.APIError as e:
+        log_message(f"OpenAI API Error on batch request: {e}. Falling back to per-company lookups.")
+        return {}
+    except Exception as e:
+        log_message(f"Unexpected error on batch request: {e}. Falling back to per-company lookups.")
+        return {}
+
+async def get_founders_for_company(company_name):
+    """LLM and scrape strategies for one company.
+
+    Wikidata is not retried here: every company reaching this function already
+    missed the Wikidata stage in process_rows_concurrently.
+    """
     log_message(f"Starting founder search for '{company_name}'.")
-    
-    # Strategy 1: Search DuckDuckGo for snippets, then use OpenAI API to extract from snippets
-    search_snippets = search_duckduckgo_for_snippets(company_name)
-    
+
+    # Strategy 1: ask the model directly. For most well-known unicorns this
+    # short prompt answers immediately and keeps the scrape plus the
+    # large-context extraction call off the critical path.
+    if client:
+        direct_response = await get_founders_via_openai(company_name)
+        cleaned_direct = clean_founder_string(direct_response, company_name)
+        if cleaned_direct != NOT_FOUND_MARKER:
+            log_message(f"Using founders from direct OpenAI lookup for '{company_name}': {cleaned_direct}")
+            return cleaned_direct
+
+    # Strategy 2: Search DuckDuckGo for snippets, then use OpenAI API to extract from snippets
+    search_snippets = await search_duckduckgo_for_snippets(company_name)
+
     if search_snippets and client:
-        api_response_from_snippets = get_founders_via_openai_with_context(company_name, search_snippets)
+        api_response_from_snippets = await get_founders_via_openai_with_context(company_name, search_snippets)
         cleaned_founders = clean_founder_string(api_response_from_snippets, company_name)
         if cleaned_founders != NOT_FOUND_MARKER:
             log_message(f"Using founders from DuckDuckGo snippets + OpenAI API for '{company_name}': {cleaned_founders}")
@@ -230,6 +675,151 @@ def get_founders_for_company(company_name):
     log_message(f"Could not find founders for '{company_name}' using DuckDuckGo + API method.")
     return NOT_FOUND_MARKER
 
+async def process_rows_concurrently(rows_to_process, writer, outfile):
+    """Fans rows out to semaphore-bounded workers; one consumer serializes CSV writes."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    results_queue = asyncio.Queue()
+
+    async def worker(row_fields, company_name, embedding):
+        async with semaphore:
+            founders_str = await get_founders_for_company(company_name)
+        if founders_str != NOT_FOUND_MARKER:
+            semantic_cache.add(company_name, embedding, founders_str)
+        await results_queue.put((row_fields, founders_str))
+
+    async def csv_writer_consumer(expected_count):
+        # Single consumer so writerow calls never interleave between tasks.
+        # No per-row flush: a ~50-byte row does not justify a syscall. Flushing
+        # every 50 rows bounds how much a crash can lose while keeping writes
+        # block-buffered.
+        for rows_written in range(1, expected_count + 1):
+            row_fields, founders_str = await results_queue.get()
+            writer.writerow(row_fields + [founders_str])
+            if rows_written % 50 == 0:
+                outfile.flush()
+
+    async def resolve_batch(batch_rows):
+        # One request answers a whole batch; returns the rows it could not answer.
+        company_names = [company_name for _, company_name, _ in batch_rows]
+        async with semaphore:
+            raw_answers = await get_founders_via_openai_batch(company_names)
+        unresolved = []
+        for row_fields, company_name, embedding in batch_rows:
+            cleaned = clean_founder_string(raw_answers.get(company_name, ""), company_name)
+            if cleaned != NOT_FOUND_MARKER:
+                log_message(f"Founders for '{company_name}' answered by batch request: {cleaned}")
+                semantic_cache.add(company_name, embedding, cleaned)
+                await results_queue.put((row_fields, cleaned))
+            else:
+                unresolved.append((row_fields, company_name, embedding))
+        return unresolved
+
+    consumer_task = asyncio.create_task(csv_writer_consumer(len(rows_to_process)))
+
+    # Stage 0: semantic cache — company-name variants of entries resolved in
+    # earlier runs are answered without any chat completion.
+    embeddings = await embed_company_names([company_name for _, company_name in rows_to_process])
+    pending_rows = []
+    if embeddings:
+        for (row_fields, company_name), embedding in zip(rows_to_process, embeddings):
+            cache_hit = semantic_cache.lookup(embedding)
+            if cache_hit is not None:
+                log_message(f"Semantic cache hit for '{company_name}' (matched '{cache_hit['company']}'): {cache_hit['founders']}")
+                await results_queue.put((row_fields, cache_hit['founders']))
+            else:
+                pending_rows.append((row_fields, company_name, embedding))
+    else:
+        pending_rows = [(row_fields, company_name, None) for row_fields, company_name in rows_to_process]
+
+    # Stage 1: Wikidata's P112 claim — authoritative names, no LLM cost. Runs
+    # for every pending company up front (concurrency is bounded by the scrape
+    # semaphore) so the batch completions below only cover Wikidata misses;
+    # this is what removes the OpenAI call for most unicorns.
+    async def resolve_via_wikidata(row):
+        row_fields, company_name, embedding = row
+        founders_str = await get_founders_via_wikidata(company_name)
+        if founders_str == NOT_FOUND_MARKER:
+            return row
+        log_message(f"Using founders from Wikidata for '{company_name}': {founders_str}")
+        semantic_cache.add(company_name, embedding, founders_str)
+        await results_queue.put((row_fields, founders_str))
+        return None
+
+    wikidata_outcomes = await asyncio.gather(*(resolve_via_wikidata(row) for row in pending_rows))
+    pending_rows = [row for row in wikidata_outcomes if row is not None]
+
+    # Stage 2: pack the Wikidata misses into JSON-mode batch requests (one RPM
+    # charge per OPENAI_BATCH_SIZE companies instead of one per company).
+    if client:
+        batch_tasks = [asyncio.create_task(resolve_batch(pending_rows[start:start + OPENAI_BATCH_SIZE]))
+                       for start in range(0, len(pending_rows), OPENAI_BATCH_SIZE)]
+        unresolved_rows = [row for batch_result in await asyncio.gather(*batch_tasks)
+                           for row in batch_result]
+    else:
+        unresolved_rows = list(pending_rows)
+
+    # Stage 3: per-company scrape + extraction for whatever the batches missed.
+    worker_tasks = [asyncio.create_task(worker(row_fields, company_name, embedding))
+                    for row_fields, company_name, embedding in unresolved_rows]
+    await asyncio.gather(*worker_tasks)
+    await consumer_task
+    await close_scrape_session()
+    semantic_cache.save()
+
+async def process_rows_via_batch_api(rows_to_process, writer, outfile):
+    """Runs every lookup through the OpenAI Batch API instead of live calls.
+
+    For bulk backfills with no latency requirement: the Batch API costs half as
+    much and draws on a separate rate pool, at a 24-hour completion SLO.
+    Requests are written to a JSONL file, uploaded, and the batch is polled
+    until it finishes; answers are joined back to their rows by custom_id.
+    """
+    log_message(f"Submitting {len(rows_to_process)} companies to the OpenAI Batch API...")
+    with open(BATCH_API_INPUT_FILE, 'w', encoding='utf-8') as f:
+        for index, (row_fields, company_name) in enumerate(rows_to_process):
+            request_line = {
+                "custom_id": str(index),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": OPENAI_MODEL,
+                    "messages": [
+                        {"role": "system", "content": "You are a helpful assistant that knows company founders. Respond with only comma-separated full names or 'Not Found'."},
+                        {"role": "user", "content": f"Who are the founders of the company '{company_name}'? List their full names, separated by commas. If you do not know, respond with only the text 'Not Found'."}
+                    ],
+                    "temperature": 0.0,
+                    "max_tokens": 150,
+                },
+            }
+            f.write(json.dumps(request_line) + "\n")
+
+    with open(BATCH_API_INPUT_FILE, 'rb') as f:
+        batch_input_file = await client.files.create(file=f, purpose='batch')
+    batch = await client.batches.create(input_file_id=batch_input_file.id,
+                                        endpoint="/v1/chat/completions",
+                                        completion_window="24h")
+    log_message(f"Batch {batch.id} submitted. Polling every {BATCH_API_POLL_SECONDS}s...")
+    while batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+        await asyncio.sleep(BATCH_API_POLL_SECONDS)
+        batch = await client.batches.retrieve(batch.id)
+
+    answers = {}
+    if batch.status == 'completed' and batch.output_file_id:
+        output_content = await client.files.content(batch.output_file_id)
+        for line in output_content.text.splitlines():
+            result = json.loads(line)
+            response_body = (result.get('response') or {}).get('body') or {}
+            choices = response_body.get('choices') or []
+            if choices:
+                answers[result['custom_id']] = choices[0]['message']['content']
+    else:
+        log_message(f"Batch {batch.id} ended with status '{batch.status}'. Unanswered companies will be marked {NOT_FOUND_MARKER}.")
+
+    for index, (row_fields, company_name) in enumerate(rows_to_process):
+        founders_str = clean_founder_string(answers.get(str(index), ""), company_name)
+        writer.writerow(row_fields + [founders_str])
+    log_message(f"Batch API processing finished with status '{batch.status}'.")
+
 def process_companies():
     log_message(f"Output will be written to: {OUTPUT_CSV_FILE}")
     output_file_exists = os.path.exists(OUTPUT_CSV_FILE)
@@ -237,14 +827,15 @@ def process_companies():
     processed_companies_set = set()
     if output_file_exists:
         try:
-            with open(OUTPUT_CSV_FILE, mode='r', encoding='utf-8', newline='') as outfile_read:
-                reader = csv.DictReader(outfile_read)
-                reader.fieldnames = [fn.strip() for fn in reader.fieldnames if fn] if reader.fieldnames else []
-                if COMPANY_NAME_COLUMN in reader.fieldnames:
-                    for row in reader:
-                        company_name_in_output = row.get(COMPANY_NAME_COLUMN)
-                        if company_name_in_output:
-                            processed_companies_set.add(company_name_in_output.strip())
+            with open(OUTPUT_CSV_FILE, mode='r', encoding='utf-8', newline='', buffering=1<<20) as outfile_read:
+                # Plain csv.reader with one column index: no per-row dict build
+                # just to learn which companies are already done.
+                reader = csv.reader(outfile_read)
+                header = [fn.strip() for fn in next(reader, []) if fn]
+                if COMPANY_NAME_COLUMN in header:
+                    company_idx = header.index(COMPANY_NAME_COLUMN)
+                    processed_companies_set = {row[company_idx].strip() for row in reader
+                                               if len(row) > company_idx and row[company_idx]}
             log_message(f"Found {len(processed_companies_set)} companies already in {OUTPUT_CSV_FILE}. Will skip these.")
         except Exception as e:
             log_message(f"Error reading existing output file {OUTPUT_CSV_FILE} for resume: {e}. Will start fresh or append.")
@@ -252,53 +843,65 @@ def process_companies():
             processed_companies_set.clear()
 
     try:
-        with open(INPUT_CSV_FILE, mode='r', encoding='utf-8', newline='') as infile, \
-             open(OUTPUT_CSV_FILE, mode='a' if output_file_exists and processed_companies_set else 'w', encoding='utf-8', newline='') as outfile:
+        with open(INPUT_CSV_FILE, mode='r', encoding='utf-8', newline='', buffering=1<<20) as infile, \
+             open(OUTPUT_CSV_FILE, mode='a' if output_file_exists and processed_companies_set else 'w', encoding='utf-8', newline='', buffering=1<<16) as outfile:
             
-            reader = csv.DictReader(infile)
-            original_fieldnames = [fn.strip() for fn in reader.fieldnames if fn] if reader.fieldnames else []
+            # Positional csv.reader/writer: column indices are resolved once from
+            # the header instead of building a dict per row.
+            reader = csv.reader(infile)
+            original_fieldnames = [fn.strip() for fn in next(reader, []) if fn]
 
             if COMPANY_NAME_COLUMN not in original_fieldnames:
                 log_message(f"ERROR: Column '{COMPANY_NAME_COLUMN}' not found in {INPUT_CSV_FILE}. Available: {original_fieldnames}")
                 return
 
+            company_idx = original_fieldnames.index(COMPANY_NAME_COLUMN)
             # Ensure FOUNDERS_COLUMN is added if not present, or is the last one if it is
+            founders_input_idx = original_fieldnames.index(FOUNDERS_COLUMN) if FOUNDERS_COLUMN in original_fieldnames else -1
             output_fieldnames = [fn for fn in original_fieldnames if fn != FOUNDERS_COLUMN] + [FOUNDERS_COLUMN]
-            
-            writer = csv.DictWriter(outfile, fieldnames=output_fieldnames, lineterminator='\n')
+            base_field_count = len(output_fieldnames) - 1 # Founders is appended at write time
+            drop_founders_from_input = founders_input_idx >= 0
+
+            writer = csv.writer(outfile, lineterminator='\n')
 
             if not output_file_exists or (outfile.tell() == 0 and not processed_companies_set): # Write header if new file or empty & not appending to existing content
-                writer.writeheader()
+                writer.writerow(output_fieldnames)
                 log_message(f"Header written to {OUTPUT_CSV_FILE}")
 
             log_message(f"Starting company processing from {INPUT_CSV_FILE}...")
-            companies_processed_this_run = 0
+            # Collect every unprocessed row up front, then hand the batch to the
+            # asyncio pipeline so API calls overlap instead of running one by one.
+            rows_to_process = []
             for i, row in enumerate(reader):
-                cleaned_row_input = {k.strip() if k and isinstance(k, str) else k: v for k, v in row.items()}
-                company_name_original = cleaned_row_input.get(COMPANY_NAME_COLUMN)
+                company_name_original = row[company_idx] if len(row) > company_idx else ''
 
                 if not company_name_original:
                     log_message(f"Skipping row {i+2} in {INPUT_CSV_FILE}: missing company name.")
                     continue
-                
+
                 company_name_cleaned = company_name_original.strip()
 
                 if company_name_cleaned in processed_companies_set:
                     continue
-                
-                companies_processed_this_run += 1
-                log_message(f"--- Processing new company ({companies_processed_this_run}): '{company_name_original}' ---")
-                
-                founders_str = get_founders_for_company(company_name_cleaned)
-                
-                output_row_dict = {fn: cleaned_row_input.get(fn, '') for fn in original_fieldnames}
-                output_row_dict[FOUNDERS_COLUMN] = founders_str
-                
-                final_output_row = {fn: output_row_dict.get(fn, '') for fn in output_fieldnames}
-                writer.writerow(final_output_row)
-                outfile.flush() 
+
+                if drop_founders_from_input:
+                    base_row = row[:founders_input_idx] + row[founders_input_idx + 1:]
+                else:
+                    base_row = list(row)
+                # Pad short rows so the appended Founders value lands in its column
+                base_row.extend([''] * (base_field_count - len(base_row)))
+                rows_to_process.append((base_row, company_name_cleaned))
+
+            companies_processed_this_run = len(rows_to_process)
+            if rows_to_process:
+                if USE_OPENAI_BATCH_API and client:
+                    asyncio.run(process_rows_via_batch_api(rows_to_process, writer, outfile))
+                else:
+                    log_message(f"Dispatching {companies_processed_this_run} companies with up to {MAX_CONCURRENT_REQUESTS} concurrent lookups...")
+                    asyncio.run(process_rows_concurrently(rows_to_process, writer, outfile))
 
         log_message(f"Finished processing. Total new companies processed in this run: {companies_processed_this_run}. Output in {OUTPUT_CSV_FILE}")
+        log_message(f"API call stats: {status_tracker.num_succeeded} succeeded, {status_tracker.num_failed} failed, {status_tracker.num_rate_limit_errors} rate-limit retries.")
 
     except FileNotFoundError:
         log_message(f"ERROR: Input file {INPUT_CSV_FILE} not found.")
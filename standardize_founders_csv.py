@@ -1,7 +1,12 @@
-import csv
+import functools
+import logging
+import logging.handlers
+import multiprocessing as mp
 import re
 import os
+import sys
 import time
+import pandas as pd # For C-level CSV I/O and string ops: pip install pandas
 
 # --- Configuration ---
 INPUT_CSV_FILE = 'Unicorns_cleaned_with_founders.csv' # Output from the previous script
@@ -9,149 +14,266 @@ OUTPUT_CSV_FILE = 'Unicorns_founders_standardized.csv'
 LOG_FILE = 'standardize_founders_log.txt'
 COMPANY_NAME_COLUMN = 'Company' # Expected header for company name
 FOUNDERS_COLUMN = 'Founders' # Expected header for founders data
+VERBOSE_LOGGING = os.getenv('STANDARDIZE_VERBOSE', '').lower() in ('1', 'true', 'yes') # Per-row log lines
+MP_CHUNK_SIZE = 1024 # Rows handed to a worker process at a time
+MIN_ROWS_FOR_MULTIPROCESSING = 5000 # Below this, pool startup costs more than it saves
 
 NOT_FOUND_MARKER = "Not Found"
-ERROR_MARKERS = [
-    "Error_API_Call_Failed", 
-    "Error_OpenAI_Client_Not_Initialized", 
+ERROR_MARKERS = frozenset([
+    "Error_API_Call_Failed",
+    "Error_OpenAI_Client_Not_Initialized",
     "Error_Unexpected_API",
     "Founders_Not_Yet_Looked_Up" # From earlier script versions
-]
+])
+# Values that map straight to Not Found: one O(1) hash lookup instead of any
+# regex work. Empty/placeholder strings are common in LLM-produced data.
+_FAST_REJECT = ERROR_MARKERS | {NOT_FOUND_MARKER, "", "N/A", "Unknown"}
+
+# File writes are buffered through a MemoryHandler and flushed in batches of
+# 1024 records, so logging stays off the per-row hot path. Per-row messages go
+# out at DEBUG and only reach the handlers when VERBOSE_LOGGING is set.
+# delay=True keeps the file closed until the first flush, which lets the
+# session-start truncation in __main__ run first.
+logger = logging.getLogger('standardize_founders')
+logger.setLevel(logging.DEBUG if VERBOSE_LOGGING else logging.INFO)
+_formatter = logging.Formatter('%(asctime)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+_console_handler = logging.StreamHandler()
+_console_handler.setFormatter(_formatter)
+logger.addHandler(_console_handler)
+_file_handler = logging.FileHandler(LOG_FILE, mode='a', encoding='utf-8', delay=True)
+_file_handler.setFormatter(_formatter)
+logger.addHandler(logging.handlers.MemoryHandler(capacity=1024, target=_file_handler))
 
 def log_message(message):
-    """Appends a message to the log file and prints it."""
-    timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
-    full_message = f"{timestamp} - {message}"
-    print(full_message)
-    try:
-        with open(LOG_FILE, 'a', encoding='utf-8') as f:
-            f.write(full_message + "\n")
-    except Exception as e:
-        print(f"Error writing to log file: {e}")
+    """Logs a message to the console and the (buffered) log file."""
+    logger.info(message)
+
+# --- Precompiled patterns (compiled once at import, not once per row) ---
+_AND_RE = re.compile(r'\s+and\s+', re.IGNORECASE)
+
+# Not-found phrasings fused into one alternation: a single scan replaces three
+# independent substring searches (and three text.lower() allocations) per row
+_NOT_FOUND_RE = re.compile(r"not found|couldn't find|unable to find", re.IGNORECASE)
+
+# Trigger tokens that appear in every boilerplate phrase and separator rewrite.
+# Rows without any of them are already clean "Name A, Name B" strings and can
+# skip straight to split/dedupe.
+_NEEDS_CLEAN_RE = re.compile(r'\b(?:founder|founders|founded|company|and)\b', re.IGNORECASE)
+
+# Rejects leftover boilerplate masquerading as a name after splitting: one
+# anchored automaton instead of a chain of lower()/startswith checks
+_INVALID_NAME_RE = re.compile(r'^(?:the company was founded by|founded by)\b', re.IGNORECASE)
+
+# Boilerplate that does not mention the company
+_STATIC_PHRASES = (
+    "The founders are ",
+    "Founders are ",
+    "The founder is ",
+    "Founder is ",
+)
+
+# Boilerplate that embeds the company name. Together with the static phrases
+# these fuse into ONE alternation per company, so each row is scanned once
+# instead of once per phrase. Alternation order matches the old removal order:
+# more specific (company-bearing) phrases first.
+_COMPANY_PHRASE_TEMPLATES = (
+    "The founders of {c} are ",
+    "Founders of {c} are ",
+    "{c}'s founders are ",
+    "The founders of the company '{c}' are ",
+    "The founder of {c} is ",
+    "Founder of {c} is ",
+    "{c}'s founder is ",
+    "The founder of the company '{c}' is ",
+)
+# Serial founders and investors recur across a unicorn list; map each distinct
+# name to one shared (interned) string instead of allocating a copy per row.
+_NAME_CACHE = {}
+
+@functools.lru_cache(maxsize=4096)
+def _lower_phrase_prefixes(company_name):
+    """Lowercased literal phrases for the startswith fast path, longest first.
+
+    Longest-first ordering mirrors the alternation's more-specific-first
+    removal so both paths strip the same text.
+    """
+    phrases = [template.replace("{c}", company_name) for template in _COMPANY_PHRASE_TEMPLATES]
+    phrases.extend(_STATIC_PHRASES)
+    return tuple(sorted((p.lower() for p in phrases), key=len, reverse=True))
+
+@functools.lru_cache(maxsize=4096)
+def _boilerplate_re(company_name):
+    """One case-sensitive alternation of all boilerplate phrases, lowercased.
+
+    Built from lowercased phrases and matched against a lowercased copy of the
+    text, so the engine skips per-character case folding (IGNORECASE); the
+    caller splices the matched spans out of the original string, which keeps
+    the founder names' casing intact.
+    """
+    escaped_company_name = re.escape(company_name.lower())
+    all_phrases = [template.format(c=escaped_company_name).lower() for template in _COMPANY_PHRASE_TEMPLATES]
+    all_phrases.extend(re.escape(p).lower() for p in _STATIC_PHRASES)
+    return re.compile("|".join(all_phrases))
+
+@functools.lru_cache(maxsize=4096)
+def _boilerplate_re_ci(company_name):
+    """IGNORECASE variant of the alternation, for rows where str.lower() is
+    not length-preserving and spans on the lowered copy cannot be mapped back.
+    """
+    escaped_company_name = re.escape(company_name)
+    all_phrases = [template.format(c=escaped_company_name) for template in _COMPANY_PHRASE_TEMPLATES]
+    all_phrases.extend(re.escape(p) for p in _STATIC_PHRASES)
+    return re.compile("|".join(all_phrases), re.IGNORECASE)
 
 def clean_founder_data(raw_founder_text, company_name):
     """Cleans the raw founder text extracted from the previous script."""
-    if not raw_founder_text or raw_founder_text.strip() == "":
-        return NOT_FOUND_MARKER
-
-    text = raw_founder_text.strip()
+    text = raw_founder_text.strip() if raw_founder_text else ""
 
-    # Check for known error/not found markers first
-    if text in ERROR_MARKERS or "not found" in text.lower() or "couldn't find" in text.lower() or "unable to find" in text.lower():
+    # Exact markers short-circuit on set membership; only then pay for the
+    # not-found phrase scan
+    if text in _FAST_REJECT or _NOT_FOUND_RE.search(text):
         return NOT_FOUND_MARKER
 
-    # Remove common boilerplate phrases more aggressively
-    # Order matters here: remove more specific phrases first.
-    phrases_to_remove = [
-        f"The founders of {company_name} are ",
-        f"Founders of {company_name} are ",
-        f"{company_name}'s founders are ",
-        f"The founders of the company '{company_name}' are ",
-        "The founders are ",
-        "Founders are ",
-        f"The founder of {company_name} is ",
-        f"Founder of {company_name} is ",
-        f"{company_name}'s founder is ",
-        f"The founder of the company '{company_name}' is ",
-        "The founder is ",
-        "Founder is ",
-    ]
-    for phrase in phrases_to_remove:
-        # Case-insensitive removal of these phrases
-        text = re.sub(re.escape(phrase), "", text, flags=re.IGNORECASE).strip()
-    
-    # Normalize separators: replace " and " with "," before splitting by comma
-    # Also handle cases like "Name1, Name2 and Name3"
-    text = re.sub(r'\s+and\s+', ", ", text, flags=re.IGNORECASE)
+    # Fast path: most rows from the pipeline already arrive as "Name A, Name B".
+    # Only run the boilerplate and separator machinery when a trigger token is
+    # actually present.
+    if _NEEDS_CLEAN_RE.search(text):
+        # Boilerplate almost always prefixes the string, and every phrase is a
+        # plain literal — so try C-level startswith/slice on a lowercased copy
+        # first. The regex alternation only runs if phrase material survives
+        # mid-string after the prefixes are gone.
+        lower_text = text.lower()
+        # str.lower() can change a string's length (e.g. 'İ' lowers to two
+        # code points), which would misalign the parallel text/lower_text
+        # slices below. Such rows skip the literal fast path and rely on the
+        # alternation instead.
+        aligned = len(lower_text) == len(text)
+        if aligned:
+            stripped_prefix = True
+            while stripped_prefix:
+                stripped_prefix = False
+                for phrase in _lower_phrase_prefixes(company_name):
+                    if lower_text.startswith(phrase):
+                        text = text[len(phrase):].lstrip()
+                        lower_text = lower_text[len(phrase):].lstrip()
+                        stripped_prefix = True
+                        break
+        if "founder" in lower_text: # Every boilerplate phrase contains this token
+            if aligned:
+                # Match against the lowered copy (case-sensitively) and splice
+                # the matched spans out of the original, so names keep their
+                # casing.
+                spans = [m.span() for m in _boilerplate_re(company_name).finditer(lower_text)]
+                if spans:
+                    pieces = []
+                    last_end = 0
+                    for start, end in spans:
+                        pieces.append(text[last_end:start])
+                        last_end = end
+                    pieces.append(text[last_end:])
+                    text = "".join(pieces).strip()
+            else:
+                # Spans on the lowered copy don't map back to the original;
+                # fall back to case-insensitive matching on the original text.
+                text = _boilerplate_re_ci(company_name).sub("", text).strip()
+
+        # Normalize separators: replace " and " with "," before splitting by comma
+        # Also handle cases like "Name1, Name2 and Name3". The three literal
+        # replaces run as C-level substring scans and cover real data; the
+        # compiled regex only runs when an odd-case or exotic-whitespace
+        # variant might survive them.
+        text = text.replace(" and ", ", ").replace(" And ", ", ").replace(" AND ", ", ")
+        if "and" in text.casefold():
+            text = _AND_RE.sub(", ", text)
     
     # Split by comma, then clean up each name
     names = [name.strip() for name in text.split(',') if name.strip()]
     
-    # Remove duplicates while preserving order (if desired, though order isn't strictly guaranteed here)
-    seen = set()
-    unique_names = []
+    # Further clean each name: trailing period and possessive 's (e.g. from
+    # "Elon Musk's company") trim as single C-level removesuffix calls
+    cleaned_names = []
     for name in names:
-        # Further clean each name: remove trailing punctuation, possessives, etc.
-        cleaned_name = name.strip()
-        if cleaned_name.endswith("."): # Remove trailing period
-            cleaned_name = cleaned_name[:-1].strip()
-        if cleaned_name.endswith("'s"): # Remove possessive 's (e.g. from "Elon Musk's company")
-            cleaned_name = cleaned_name[:-2].strip() 
-        
-        if cleaned_name and cleaned_name not in seen:
-            # Basic check to avoid adding leftover boilerplate as a name
-            if len(cleaned_name) > 1 and not cleaned_name.lower().startswith("the company was founded by") \
-               and not cleaned_name.lower().startswith("founded by") \
-               and not cleaned_name.lower() == company_name.lower():
-                unique_names.append(cleaned_name)
-                seen.add(cleaned_name)
-    
+        cleaned_name = name.strip().removesuffix(".").removesuffix("'s").strip()
+        if cleaned_name:
+            cleaned_names.append(_NAME_CACHE.setdefault(cleaned_name, sys.intern(cleaned_name)))
+
+    # Dedupe in one C-level pass: dict preserves insertion order (3.7+), then a
+    # comprehension filters out leftover boilerplate masquerading as a name
+    company_folded = company_name.casefold() # Folded once, not per name
+    unique_names = [name for name in dict.fromkeys(cleaned_names)
+                    if len(name) > 1
+                    and not _INVALID_NAME_RE.match(name)
+                    and name.casefold() != company_folded]
+
     if not unique_names:
         # If after cleaning, no valid names remain, but original text was not a clear "not found"
-        log_message(f"Could not extract valid founder names for '{company_name}' from: '{raw_founder_text}'. Marking as Not Found.")
+        logger.debug(f"Could not extract valid founder names for '{company_name}' from: '{raw_founder_text}'. Marking as Not Found.")
         return NOT_FOUND_MARKER
         
     return ", ".join(unique_names)
 
+def _clean_pair(pair):
+    """Top-level worker for Pool.imap: (raw_founders, company_name) -> cleaned string."""
+    raw_value, company_name = pair
+    if not company_name:
+        return NOT_FOUND_MARKER
+    return clean_founder_data(raw_value, company_name)
+
 def standardize_csv_data():
     """Reads the input CSV, cleans founder data, and writes to a new CSV."""
     log_message(f"Starting standardization process for {INPUT_CSV_FILE}...")
-    processed_rows = []
-
     try:
-        with open(INPUT_CSV_FILE, mode='r', encoding='utf-8', newline='') as infile:
-            reader = csv.DictReader(infile)
-            
-            # Clean fieldnames from the input file
-            original_fieldnames = [fn.strip() for fn in reader.fieldnames if fn is not None] if reader.fieldnames else []
-            
-            if COMPANY_NAME_COLUMN not in original_fieldnames or FOUNDERS_COLUMN not in original_fieldnames:
-                log_message(f"ERROR: Required columns ('{COMPANY_NAME_COLUMN}', '{FOUNDERS_COLUMN}') not found in {INPUT_CSV_FILE}.")
-                log_message(f"Available columns: {original_fieldnames}")
-                return
-            
-            # The output fieldnames will be the same as input, as we are modifying in place
-            output_fieldnames = original_fieldnames
-            processed_rows.append(dict(zip(output_fieldnames, output_fieldnames))) # conceptual header
-
-            for i, row in enumerate(reader):
-                # Clean keys in the row dictionary, as they might have whitespace from input file
-                cleaned_row_data = {k.strip() if k else k: v for k, v in row.items()}
-
-                company_name = cleaned_row_data.get(COMPANY_NAME_COLUMN, "").strip()
-                raw_founders = cleaned_row_data.get(FOUNDERS_COLUMN, "")
-
-                if not company_name:
-                    log_message(f"Skipping row {i+2} due to missing company name.")
-                    # Keep other data, set founders to NOT_FOUND_MARKER
-                    new_row = {fn: cleaned_row_data.get(fn, '') for fn in output_fieldnames if fn != FOUNDERS_COLUMN}
-                    new_row[FOUNDERS_COLUMN] = NOT_FOUND_MARKER 
-                    processed_rows.append(new_row)
-                    continue
-                
-                log_message(f"Standardizing founders for company ({i+1}): {company_name}")
-                cleaned_founders_str = clean_founder_data(raw_founders, company_name)
-                
-                # Create the new row for output
-                output_row = {fn: cleaned_row_data.get(fn, '') for fn in output_fieldnames}
-                output_row[FOUNDERS_COLUMN] = cleaned_founders_str
-                processed_rows.append(output_row)
-
+        # dtype=str + keep_default_na=False keep every cell a plain string,
+        # matching what the csv module produced. The explicit 1 MiB buffer
+        # replaces the default 8 KiB one, so multi-MB files read in large
+        # chunks rather than many small syscalls.
+        with open(INPUT_CSV_FILE, mode='r', encoding='utf-8', newline='', buffering=1<<20) as infile:
+            df = pd.read_csv(infile, dtype=str, keep_default_na=False)
     except FileNotFoundError:
         log_message(f"ERROR: Input file {INPUT_CSV_FILE} not found.")
         return
     except Exception as e:
-        log_message(f"An error occurred during CSV reading or processing: {e}")
-        # Consider re-raising or handling more gracefully if it's a critical error
+        log_message(f"An error occurred while reading {INPUT_CSV_FILE}: {e}")
+        return
+
+    df.columns = df.columns.str.strip()
+    if COMPANY_NAME_COLUMN not in df.columns or FOUNDERS_COLUMN not in df.columns:
+        log_message(f"ERROR: Required columns ('{COMPANY_NAME_COLUMN}', '{FOUNDERS_COLUMN}') not found in {INPUT_CSV_FILE}.")
+        log_message(f"Available columns: {list(df.columns)}")
         return
 
+    # Whitespace stripping runs as vectorized pandas string kernels; the
+    # boilerplate cleaning stays row-wise because each row's patterns depend on
+    # its company name.
+    companies = df[COMPANY_NAME_COLUMN].str.strip()
+    raw_founders = df[FOUNDERS_COLUMN].str.strip()
+
+    missing_company_rows = companies[companies == ''].index
+    for row_index in missing_company_rows:
+        log_message(f"Skipping row {row_index + 2} due to missing company name.")
+
+    pairs = list(zip(raw_founders, companies))
+    if VERBOSE_LOGGING:
+        cleaned = []
+        for i, (raw_value, company_name) in enumerate(pairs):
+            if not company_name:
+                cleaned.append(NOT_FOUND_MARKER)
+                continue
+            logger.debug(f"Standardizing founders for company ({i+1}): {company_name}")
+            cleaned.append(clean_founder_data(raw_value, company_name))
+    elif len(pairs) >= MIN_ROWS_FOR_MULTIPROCESSING:
+        # Row cleaning is pure and embarrassingly parallel. imap (ordered)
+        # keeps results aligned with their rows; the precompiled module-level
+        # patterns are inherited by forked workers without re-pickling.
+        with mp.Pool() as pool:
+            cleaned = list(pool.imap(_clean_pair, pairs, chunksize=MP_CHUNK_SIZE))
+    else:
+        cleaned = [_clean_pair(pair) for pair in pairs]
+    df[FOUNDERS_COLUMN] = cleaned
+
     try:
-        with open(OUTPUT_CSV_FILE, mode='w', encoding='utf-8', newline='') as outfile:
-            writer = csv.DictWriter(outfile, fieldnames=output_fieldnames)
-            # Write the actual header first
-            writer.writerow(processed_rows[0]) 
-            # Write the data rows (excluding the conceptual header we added to processed_rows)
-            writer.writerows(processed_rows[1:]) 
+        with open(OUTPUT_CSV_FILE, mode='w', encoding='utf-8', newline='', buffering=1<<20) as outfile:
+            df.to_csv(outfile, index=False)
         log_message(f"Successfully standardized founder data. Output written to {OUTPUT_CSV_FILE}")
     except Exception as e:
         log_message(f"An error occurred while writing to {OUTPUT_CSV_FILE}: {e}")